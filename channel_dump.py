@@ -5,23 +5,46 @@ Outputs:
 - data/raw/manifest.csv           (video metadata)
 - data/raw/transcripts.jsonl      (one JSON per line with transcript text + metadata)
 - data/raw/transcripts/{id}.json  (per-video full record)
+- .cache/transcripts.sqlite       (transcript + listing cache; disable with --no-cache)
 """
 
 from __future__ import annotations
 
 import argparse
+import asyncio
 import csv
-import json
+import functools
+import io
+import sqlite3
+import threading
 import time
 from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import orjson
+import requests
+import youtube_transcript_api
 import yt_dlp
+from requests.adapters import HTTPAdapter
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
+from urllib3.util.retry import Retry
 from youtube_transcript_api import (
     YouTubeTranscriptApi,
 )
 
+# Throttling / transient failures worth retrying. 1.x raises RequestBlocked (IpBlocked on
+# HTTP 429); older releases raise TooManyRequests. Terminal errors such as
+# TranscriptsDisabled or NoTranscriptFound are deliberately not listed, nor is
+# YouTubeRequestFailed: it wraps every other HTTP error, including 403/404.
+# Each status is retried by exactly one layer: 429 only here (jittered backoff), 5xx
+# only by the session's urllib3 Retry.
+RETRYABLE_TRANSCRIPT_ERRORS: tuple[type[BaseException], ...] = tuple(
+    getattr(youtube_transcript_api, name)
+    for name in ("RequestBlocked", "TooManyRequests")
+    if hasattr(youtube_transcript_api, name)
+) + (requests.ConnectionError, requests.Timeout)
+
 
 # ----------------------------
 # Data models
@@ -57,10 +80,85 @@ def ensure_dirs(base: Path) -> Dict[str, Path]:
         "tx_dir": out_tx_dir,
         "manifest_csv": out_raw / "manifest.csv",
         "transcripts_jsonl": out_raw / "transcripts.jsonl",
+        "cache_db": base / ".cache" / "transcripts.sqlite",
     }
 
 
+LISTING_TTL_S = 24 * 60 * 60
+
+
+class TranscriptCache:
+    """
+    SQLite-backed cache so re-runs skip the network.
+    Transcript variants are kept indefinitely; channel listings expire after a TTL.
+    """
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS transcripts (
+                video_id TEXT NOT NULL,
+                langs TEXT NOT NULL,
+                payload BLOB NOT NULL,
+                PRIMARY KEY (video_id, langs)
+            );
+            CREATE TABLE IF NOT EXISTS listings (
+                channel_url TEXT NOT NULL,
+                max_videos INTEGER NOT NULL,
+                fetched_at REAL NOT NULL,
+                payload BLOB NOT NULL,
+                PRIMARY KEY (channel_url, max_videos)
+            );
+            """
+        )
+
+    def get_transcript(self, video_id: str, preferred_langs: List[str]) -> dict | None:
+        row = self._conn.execute(
+            "SELECT payload FROM transcripts WHERE video_id = ? AND langs = ?",
+            (video_id, ",".join(preferred_langs)),
+        ).fetchone()
+        return orjson.loads(row[0]) if row else None
+
+    def put_transcript(self, video_id: str, preferred_langs: List[str], variant: dict) -> None:
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO transcripts VALUES (?, ?, ?)",
+                (video_id, ",".join(preferred_langs), orjson.dumps(variant)),
+            )
+
+    def get_listing(
+        self, channel_url: str, max_videos: Optional[int], ttl_s: float = LISTING_TTL_S
+    ) -> List[VideoMeta] | None:
+        row = self._conn.execute(
+            "SELECT fetched_at, payload FROM listings WHERE channel_url = ? AND max_videos = ?",
+            (channel_url, max_videos or 0),
+        ).fetchone()
+        if not row or time.time() - row[0] > ttl_s:
+            return None
+        return [VideoMeta(**v) for v in orjson.loads(row[1])]
+
+    def put_listing(
+        self, channel_url: str, max_videos: Optional[int], videos: List[VideoMeta]
+    ) -> None:
+        payload = orjson.dumps([asdict(v) for v in videos])
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO listings VALUES (?, ?, ?, ?)",
+                (channel_url, max_videos or 0, time.time(), payload),
+            )
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+@functools.lru_cache(maxsize=1)
 def _ydl() -> yt_dlp.YoutubeDL:
+    # One shared instance so its request handlers (and their connection pools)
+    # are reused across listings instead of re-doing TLS handshakes per call.
+    # Accept-Encoding is left to yt_dlp: it advertises exactly what it can decode
+    # (gzip/deflate, plus br when brotli is installed — see requirements.txt).
     # extract_flat avoids fetching formats; faster for listing
     opts = {
         "extract_flat": "in_playlist",
@@ -119,6 +217,52 @@ def list_channel_videos(channel_url: str, max_videos: Optional[int] = None) -> L
     return videos
 
 
+_local = threading.local()
+
+
+def _get_session() -> requests.Session:
+    """
+    Pooled HTTP session for the transcript API, so TLS connections are reused across videos.
+    One per thread: youtube-transcript-api documents its Session use as not thread-safe,
+    and the to_thread workers are long-lived, so each keeps its own warm pool.
+    """
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        retries = Retry(
+            total=3,
+            backoff_factor=0.5,
+            # 5xx only: 429 is left to the tenacity backoff below, so the two layers
+            # never multiply on throttling
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=["GET", "POST"],  # transcript lookups POST to innertube
+            respect_retry_after_header=False,  # keep waits bounded by backoff_factor
+            # hand the final response back so the API maps it to its own errors
+            raise_on_status=False,
+        )
+        session.mount("https://", HTTPAdapter(pool_maxsize=32, max_retries=retries))
+        _local.session = session
+    return session
+
+
+_youtube_retry = retry(
+    reraise=True,
+    stop=stop_after_attempt(5),
+    wait=wait_random_exponential(multiplier=1, max=30),
+    retry=retry_if_exception_type(RETRYABLE_TRANSCRIPT_ERRORS),
+)
+
+
+@_youtube_retry
+def _list_with_retry(list_fn: Any, video_id: str) -> Any:
+    return list_fn(video_id)
+
+
+@_youtube_retry
+def _fetch_with_retry(t: Any) -> Any:
+    return t.fetch()
+
+
 def pick_transcript_variant(video_id: str, preferred_langs: list[str]) -> dict | None:
     """
     Returns dict { 'lang', 'is_generated', 'segments' } where 'segments' is a list[dict].
@@ -126,14 +270,15 @@ def pick_transcript_variant(video_id: str, preferred_langs: list[str]) -> dict |
     """
     # Try the new instance API first (v1.2+)
     try:
-        api = YouTubeTranscriptApi()  # v1.2+: instance exposes .list()
+        # v1.2+: instance exposes .list() and accepts a shared http_client
+        api = YouTubeTranscriptApi(http_client=_get_session())
         has_new_api = hasattr(api, "list")
     except TypeError:
         has_new_api = False
 
     if has_new_api:
         try:
-            tx_list: Any = api.list(video_id)
+            tx_list: Any = _list_with_retry(api.list, video_id)
         except Exception:
             return None
 
@@ -141,7 +286,7 @@ def pick_transcript_variant(video_id: str, preferred_langs: list[str]) -> dict |
         for lang in preferred_langs:
             try:
                 t = tx_list.find_manually_created_transcript([lang])
-                raw = t.fetch().to_raw_data()  # normalize to list[dict]
+                raw = _fetch_with_retry(t).to_raw_data()  # normalize to list[dict]
                 return {"lang": t.language_code, "is_generated": False, "segments": raw}
             except Exception:
                 pass
@@ -150,7 +295,7 @@ def pick_transcript_variant(video_id: str, preferred_langs: list[str]) -> dict |
         for lang in preferred_langs:
             try:
                 t = tx_list.find_generated_transcript([lang])
-                raw = t.fetch().to_raw_data()
+                raw = _fetch_with_retry(t).to_raw_data()
                 return {"lang": t.language_code, "is_generated": True, "segments": raw}
             except Exception:
                 pass
@@ -158,7 +303,7 @@ def pick_transcript_variant(video_id: str, preferred_langs: list[str]) -> dict |
         # Fallback: first available
         try:
             t = next(iter(tx_list))
-            raw = t.fetch().to_raw_data()
+            raw = _fetch_with_retry(t).to_raw_data()
             return {"lang": t.language_code, "is_generated": t.is_generated, "segments": raw}
         except Exception:
             return None
@@ -168,25 +313,28 @@ def pick_transcript_variant(video_id: str, preferred_langs: list[str]) -> dict |
     list_fn = getattr(YouTubeTranscriptApi, "list_transcripts", None)
     if callable(list_fn):
         try:
-            tx_list: Any = list_fn(video_id)
+            tx_list: Any = _list_with_retry(list_fn, video_id)
         except Exception:
             return None
 
         for lang in preferred_langs:
             try:
                 t = tx_list.find_manually_created_transcript([lang])
-                return {"lang": t.language_code, "is_generated": False, "segments": t.fetch()}
+                segs = _fetch_with_retry(t)
+                return {"lang": t.language_code, "is_generated": False, "segments": segs}
             except Exception:
                 pass
         for lang in preferred_langs:
             try:
                 t = tx_list.find_generated_transcript([lang])
-                return {"lang": t.language_code, "is_generated": True, "segments": t.fetch()}
+                segs = _fetch_with_retry(t)
+                return {"lang": t.language_code, "is_generated": True, "segments": segs}
             except Exception:
                 pass
         try:
             t = next(iter(tx_list))
-            return {"lang": t.language_code, "is_generated": t.is_generated, "segments": t.fetch()}
+            segs = _fetch_with_retry(t)
+            return {"lang": t.language_code, "is_generated": t.is_generated, "segments": segs}
         except Exception:
             return None
 
@@ -206,13 +354,17 @@ def pick_transcript_variant(video_id: str, preferred_langs: list[str]) -> dict |
 
 
 def segments_to_text(segments: List[Dict]) -> str:
-    # Concatenate lines; strip extra whitespace
-    lines = []
+    # Concatenate lines; strip extra whitespace. Single pass into one buffer, no line list.
+    buf = io.StringIO()
     for s in segments:
-        txt = (s.get("text") or "").strip()
+        txt = s.get("text")
+        if txt is None:
+            continue
+        txt = txt.strip()
         if txt:
-            lines.append(txt)
-    return "\n".join(lines)
+            buf.write(txt)
+            buf.write("\n")
+    return buf.getvalue().rstrip("\n")
 
 
 def write_manifest(path_csv: Path, videos: List[VideoMeta]) -> None:
@@ -225,41 +377,61 @@ def write_manifest(path_csv: Path, videos: List[VideoMeta]) -> None:
 
 
 def append_jsonl(path_jsonl: Path, obj: Dict) -> None:
-    with path_jsonl.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(obj, ensure_ascii=False) + "\n")
+    with path_jsonl.open("ab") as f:
+        f.write(orjson.dumps(obj) + b"\n")
 
 
 # ----------------------------
 # Main pipeline
 # ----------------------------
-def fetch_and_store(
-    channel_url: str,
-    out_base: Path,
-    preferred_langs: List[str],
-    max_videos: Optional[int] = None,
-    delay_s: float = 0.4,
-) -> None:
-    paths = ensure_dirs(out_base)
+def _write_record(paths: Dict[str, Path], rec_path: Path, payload: Dict) -> None:
+    # per-video JSON
+    with rec_path.open("wb") as f:
+        f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+
+    # append to combined JSONL
+    append_jsonl(paths["transcripts_jsonl"], payload)
 
-    print(f"[1/3] Listing videos from: {channel_url}")
-    videos = list_channel_videos(channel_url, max_videos=max_videos)
-    print(f"  → Found {len(videos)} videos")
 
-    print(f"[2/3] Writing manifest: {paths['manifest_csv']}")
-    write_manifest(paths["manifest_csv"], videos)
+async def _fetch_transcripts(
+    videos: List[VideoMeta],
+    paths: Dict[str, Path],
+    preferred_langs: List[str],
+    concurrency: int,
+    delay_s: float,
+    cache: TranscriptCache | None = None,
+) -> None:
+    sem = asyncio.Semaphore(max(concurrency, 1))
+    # Single consumer keeps the per-video files and transcripts.jsonl appends serialized.
+    # Every video posts (index, path, payload-or-None) so the writer can restore channel order.
+    queue: asyncio.Queue[Optional[Tuple[int, Path, Optional[Dict]]]] = asyncio.Queue()
+    total = len(videos)
 
-    print(f"[3/3] Fetching transcripts into: {paths['tx_dir']}")
-    for i, v in enumerate(videos, start=1):
-        print(f"  ({i}/{len(videos)}) {v.id}  {v.title!r}")
+    async def fetch_one(i: int, v: VideoMeta) -> None:
         rec_path = paths["tx_dir"] / f"{v.id}.json"
+        await queue.put((i, rec_path, await load_payload(i, v, rec_path)))
+
+    async def load_payload(i: int, v: VideoMeta, rec_path: Path) -> Optional[Dict]:
         if rec_path.exists():
-            print("    - already exists, skipping")
-            continue
+            print(f"  ({i}/{total}) {v.id}  {v.title!r}\n    - already exists, skipping")
+            return None
+
+        variant = cache.get_transcript(v.id, preferred_langs) if cache else None
+        if variant is None:
+            async with sem:
+                # the transcript API is blocking; run it off the event loop
+                variant = await asyncio.to_thread(pick_transcript_variant, v.id, preferred_langs)
+                # polite delay (avoid hammering APIs); held under the semaphore so the
+                # request rate stays capped at roughly concurrency / delay_s
+                await asyncio.sleep(delay_s)
+            # misses are not cached: they may be transient
+            if variant and cache:
+                cache.put_transcript(v.id, preferred_langs, variant)
 
-        variant = pick_transcript_variant(v.id, preferred_langs)
         if not variant:
-            print("    - no transcript available")
-            continue
+            print(f"  ({i}/{total}) {v.id}  {v.title!r}\n    - no transcript available")
+            return None
+        print(f"  ({i}/{total}) {v.id}  {v.title!r}")
 
         text = segments_to_text(variant["segments"])
         record = TranscriptRecord(
@@ -268,22 +440,69 @@ def fetch_and_store(
             is_generated=variant.get("is_generated"),
             text=text,
         )
-        payload = {
+        return {
             "meta": asdict(record.meta),
             "language": record.language,
             "is_generated": record.is_generated,
             "text": record.text,
         }
 
-        # per-video JSON
-        with rec_path.open("w", encoding="utf-8") as f:
-            json.dump(payload, f, ensure_ascii=False, indent=2)
+    async def writer() -> None:
+        # Fetches finish out of order; hold early arrivals so records are written in
+        # channel order, as the sequential loop did.
+        pending: Dict[int, Tuple[Path, Optional[Dict]]] = {}
+        next_i = 1
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            i, rec_path, payload = item
+            pending[i] = (rec_path, payload)
+            while next_i in pending:
+                rec_path, payload = pending.pop(next_i)
+                next_i += 1
+                if payload is not None:
+                    await asyncio.to_thread(_write_record, paths, rec_path, payload)
+
+    writer_task = asyncio.create_task(writer())
+    try:
+        await asyncio.gather(*(fetch_one(i, v) for i, v in enumerate(videos, start=1)))
+    finally:
+        await queue.put(None)
+        await writer_task
 
-        # append to combined JSONL
-        append_jsonl(paths["transcripts_jsonl"], payload)
 
-        # polite delay (avoid hammering APIs)
-        time.sleep(delay_s)
+def fetch_and_store(
+    channel_url: str,
+    out_base: Path,
+    preferred_langs: List[str],
+    max_videos: Optional[int] = None,
+    delay_s: float = 0.4,
+    concurrency: int = 8,
+    use_cache: bool = True,
+) -> None:
+    paths = ensure_dirs(out_base)
+    cache = TranscriptCache(paths["cache_db"]) if use_cache else None
+
+    try:
+        print(f"[1/3] Listing videos from: {channel_url}")
+        videos = cache.get_listing(channel_url, max_videos) if cache else None
+        if videos is None:
+            videos = list_channel_videos(channel_url, max_videos=max_videos)
+            if cache:
+                cache.put_listing(channel_url, max_videos, videos)
+        else:
+            print("  → Using cached listing")
+        print(f"  → Found {len(videos)} videos")
+
+        print(f"[2/3] Writing manifest: {paths['manifest_csv']}")
+        write_manifest(paths["manifest_csv"], videos)
+
+        print(f"[3/3] Fetching transcripts into: {paths['tx_dir']}")
+        asyncio.run(_fetch_transcripts(videos, paths, preferred_langs, concurrency, delay_s, cache))
+    finally:
+        if cache:
+            cache.close()
 
 
 def parse_args() -> argparse.Namespace:
@@ -300,7 +519,18 @@ def parse_args() -> argparse.Namespace:
         "--max", type=int, default=None, help="Max number of videos to process (default: all)"
     )
     p.add_argument(
-        "--delay", type=float, default=0.4, help="Delay between transcript fetches (seconds)"
+        "--delay",
+        type=float,
+        default=0.4,
+        help="Pause each fetch holds its concurrency slot for afterwards (seconds)",
+    )
+    p.add_argument(
+        "--concurrency", type=int, default=8, help="Max transcript fetches in flight (default: 8)"
+    )
+    p.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the on-disk transcript/listing cache (.cache/transcripts.sqlite)",
     )
     return p.parse_args()
 
@@ -315,6 +545,8 @@ def main():
         preferred_langs=langs,
         max_videos=args.max,
         delay_s=args.delay,
+        concurrency=args.concurrency,
+        use_cache=not args.no_cache,
     )
 
 
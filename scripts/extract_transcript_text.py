@@ -1,12 +1,16 @@
 #!/usr/bin/env python3
-"""Convert a transcript JSON file into plain text."""
+"""Convert transcript JSON files into plain text."""
 
 from __future__ import annotations
 
 import argparse
-import json
+import asyncio
+import glob
+import sys
 from pathlib import Path
 
+import orjson
+
 DEFAULT_OUT_DIR = Path("data") / "transcript_text"
 
 
@@ -20,8 +24,9 @@ def extract_text(json_file: Path, out_dir: Path | None = None) -> Path:
     out_dir.mkdir(parents=True, exist_ok=True)
 
     try:
-        data = json.loads(json_file.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as exc:  # pragma: no cover - message tested via CLI
+        # orjson parses the raw bytes directly, skipping a separate UTF-8 decode
+        data = orjson.loads(json_file.read_bytes())
+    except orjson.JSONDecodeError as exc:  # pragma: no cover - message tested via CLI
         raise ValueError(f"Malformed JSON: {exc}") from exc
 
     text = data.get("text")
@@ -29,20 +34,47 @@ def extract_text(json_file: Path, out_dir: Path | None = None) -> Path:
         raise ValueError("Missing 'text' field in transcript JSON")
 
     out_file = out_dir / (json_file.stem + ".txt")
-    out_file.write_text(text, encoding="utf-8")
+    out_file.write_bytes(text.encode("utf-8"))
     return out_file
 
 
+async def extract_many(
+    json_files: list[Path], out_dir: Path | None = None
+) -> list[Path | BaseException]:
+    """Run :func:`extract_text` over *json_files* concurrently so file I/O overlaps.
+
+    Returns one entry per input, in order: the written path or the raised exception.
+    """
+
+    async def process(json_file: Path) -> Path:
+        return await asyncio.to_thread(extract_text, json_file, out_dir)
+
+    return await asyncio.gather(*(process(p) for p in json_files), return_exceptions=True)
+
+
 def main() -> None:
-    parser = argparse.ArgumentParser(description="Extract transcript text from a JSON file")
-    parser.add_argument("json_file", type=Path, help="Path to transcript JSON file")
+    parser = argparse.ArgumentParser(description="Extract transcript text from JSON files")
+    parser.add_argument("json_files", nargs="*", type=Path, help="Paths to transcript JSON files")
+    parser.add_argument(
+        "--glob", help="Glob pattern for transcript JSON files, e.g. 'data/raw/transcripts/*.json'"
+    )
     args = parser.parse_args()
 
-    try:
-        out_path = extract_text(args.json_file)
-    except Exception as exc:  # pragma: no cover - exercised via CLI tests
-        parser.exit(1, f"Error: {exc}\n")
-    print(f"Wrote {out_path}")
+    json_files = list(args.json_files)
+    if args.glob:
+        json_files.extend(Path(p) for p in sorted(glob.glob(args.glob)))
+    if not json_files:
+        parser.error("no transcript JSON files given")
+
+    failed = False
+    for json_file, result in zip(json_files, asyncio.run(extract_many(json_files)), strict=True):
+        if isinstance(result, BaseException):  # pragma: no cover - exercised via CLI tests
+            failed = True
+            print(f"Error: {json_file}: {result}", file=sys.stderr)
+        else:
+            print(f"Wrote {result}")
+    if failed:
+        sys.exit(1)
 
 
 if __name__ == "__main__":  # pragma: no cover
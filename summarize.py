@@ -4,12 +4,17 @@ from __future__ import annotations
 
 import argparse
 import csv
+import functools
+import multiprocessing
 import os
 import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Tuple
+from typing import Callable, Deque, Iterable, Iterator, List, Tuple, TypeVar
 
 import orjson
 import tiktoken
@@ -35,6 +40,7 @@ class Config:
     max_output_tokens: int
     chunk_size_tokens: int
     chunk_overlap_tokens: int
+    map_batch_tokens: int
     input_jsonl: str
     output_csv: str
     output_md: str
@@ -56,6 +62,8 @@ def load_config(path: Path) -> Config:
         max_output_tokens=int(data["max_output_tokens"]),
         chunk_size_tokens=int(data["chunk_size_tokens"]),
         chunk_overlap_tokens=int(data["chunk_overlap_tokens"]),
+        # older configs without this key keep one chunk per map call
+        map_batch_tokens=int(data.get("map_batch_tokens", data["chunk_size_tokens"])),
         input_jsonl=data["input_jsonl"],
         output_csv=data["output_csv"],
         output_md=data["output_md"],
@@ -70,10 +78,10 @@ def load_config(path: Path) -> Config:
 
 
 def iter_jsonl(path: Path) -> Iterable[dict]:
-    with path.open("r", encoding="utf-8") as f:
+    # orjson parses bytes directly and tolerates surrounding whitespace, so no decode/strip copy
+    with path.open("rb") as f:
         for line in f:
-            line = line.strip()
-            if not line:
+            if line.isspace():
                 continue
             yield orjson.loads(line)
 
@@ -82,10 +90,32 @@ def ensure_dirs(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
 
+def select_records(
+    records: Iterable[dict],
+    done: set[str],
+    ids: set[str] | None = None,
+    limit: int | None = None,
+) -> Iterator[dict]:
+    """Lazily yield records that still need summarizing, stopping after *limit* of them."""
+    n = 0
+    for rec in records:
+        vid = rec.get("meta", {}).get("id", "")
+        if not vid or vid in done:
+            continue
+        if ids is not None and vid not in ids:
+            continue
+        yield rec
+        n += 1
+        if limit and n >= limit:
+            return
+
+
 # ---------- Tokenization & chunking ----------
 
 
+@functools.lru_cache(maxsize=4)
 def get_encoder_for_model(model: str):
+    # Cached: loading the BPE tables is slow, and encoders are thread-safe to share.
     # try model-specific; fallback to cl100k_base
     try:
         return tiktoken.encoding_for_model(model)
@@ -96,36 +126,83 @@ def get_encoder_for_model(model: str):
 def chunk_text_by_tokens(text: str, chunk_size: int, overlap: int, enc) -> List[str]:
     if not text:
         return []
+    # Fast paths for text that fits in one chunk. BPE tokens span at least one byte,
+    # so a UTF-8 length within the budget guarantees a fit without tokenizing at all.
+    if len(text) <= chunk_size and len(text.encode("utf-8")) <= chunk_size:
+        return [text]
     toks = enc.encode(text)
     n = len(toks)
-    chunks = []
+    if n <= chunk_size:
+        return [text]  # skip the decode round-trip
+    slices = []
     start = 0
     while start < n:
         end = min(start + chunk_size, n)
-        chunk_ids = toks[start:end]
-        chunks.append(enc.decode(chunk_ids))
+        slices.append(toks[start:end])
         if end == n:
             break
         start = max(end - overlap, 0)
-    return chunks
+    # plain per-slice decode: tiktoken's decode_batch spins up a thread pool per call,
+    # which costs more than it saves for a handful of slices
+    return [enc.decode(s) for s in slices]
+
+
+def pack_chunks(
+    chunks: List[str], max_ctx_tokens: int, chunk_tokens: int, overhead: int = 16
+) -> List[List[str]]:
+    """
+    Group consecutive chunks so each group fits in *max_ctx_tokens*. Chunks come from
+    chunk_text_by_tokens, so each holds at most *chunk_tokens* tokens; that bound is used
+    instead of tokenizing them a second time.
+    """
+    if len(chunks) <= 1:
+        return [chunks] if chunks else []
+    # overhead covers the numbered header of each chunk
+    per_batch = max(max_ctx_tokens // (chunk_tokens + overhead), 1)
+    return [chunks[i : i + per_batch] for i in range(0, len(chunks), per_batch)]
+
+
+def format_chunks_block(batch: List[str]) -> str:
+    return "\n\n".join(f"[{i}]\n{ch}" for i, ch in enumerate(batch, start=1))
+
+
+def split_batch_output(out: str, n: int) -> List[str]:
+    """Split a batched map response into one bullet block per input chunk."""
+    parts = [part.strip() for part in out.split(MAP_SEP)]
+    parts = [part for part in parts if part]
+    if len(parts) != n:
+        # model ignored the separator; the reduce step only needs the bullets, so keep it whole
+        return [out.strip()]
+    return parts
 
 
 # ---------- OpenAI calls ----------
 
 
 class RateLimiter:
-    """Very simple client-side throttle."""
+    """
+    Client-side token bucket: sustains *rps* calls per second and allows bursts of up to
+    *burst* calls (default: one second's worth). Safe to share between threads.
+    """
 
-    def __init__(self, rps: float):
-        self.min_interval = 1.0 / max(rps, 1e-6)
-        self._last = 0.0
+    def __init__(self, rps: float, burst: float | None = None):
+        self.rps = max(rps, 1e-6)
+        self.capacity = max(burst if burst is not None else rps, 1.0)
+        self._tokens = self.capacity
+        self._last = time.perf_counter()
+        self._lock = threading.Lock()
 
     def wait(self):
-        now = time.perf_counter()
-        delta = now - self._last
-        if delta < self.min_interval:
-            time.sleep(self.min_interval - delta)
-        self._last = time.perf_counter()
+        with self._lock:
+            now = time.perf_counter()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rps)
+            self._last = now
+            self._tokens -= 1
+            # A negative balance is debt: this caller sleeps it off (outside the lock),
+            # and callers arriving meanwhile queue up behind it.
+            delay = -self._tokens / self.rps if self._tokens < 0 else 0.0
+        if delay > 0:
+            time.sleep(delay)
 
 
 def build_client() -> OpenAI:
@@ -165,6 +242,23 @@ def chat_complete(
 
 # ---------- Summarization pipeline ----------
 
+MAP_SEP = "===SEP==="
+
+
+def build_map_prompt(template: str, chunks_block: str) -> str:
+    """
+    Static template first, variable chunk text last, so the shared prefix is eligible
+    for OpenAI prompt caching. Older templates end in a {chunk_text} placeholder; it is
+    dropped rather than sent to the model literally.
+    """
+    prefix = template.replace("{chunk_text}", "").replace("{chunks_block}", "").rstrip()
+    return f"{prefix}\n\n{chunks_block}"
+
+
+def build_reduce_prompt(template: str, merged_bullets: str) -> str:
+    return f"{template.rstrip()}\n\n=== BULLETS START ===\n{merged_bullets}\n=== BULLETS END ==="
+
+
 SYSTEM_MAP = (
     "You are a precise technical summarizer. Output only the requested bullets; no preamble."
 )
@@ -195,11 +289,13 @@ def summarize_one_video(
         enc=enc,
     )
 
-    # 2) Map: summarize each chunk
-    map_bullets = []
-    for ch in chunks:
+    # 2) Map: summarize chunks, several per call when they fit (independent calls,
+    #    so run them concurrently)
+    batches = pack_chunks(chunks, cfg.map_batch_tokens, cfg.chunk_size_tokens)
+
+    def map_batch(batch: List[str]) -> List[str]:
         throttle.wait()
-        user_prompt = cfg.map_prompt.replace("{chunk_text}", ch)
+        user_prompt = build_map_prompt(cfg.map_prompt, format_chunks_block(batch))
         out = chat_complete(
             client=client,
             model=cfg.model,
@@ -208,18 +304,17 @@ def summarize_one_video(
             temperature=cfg.temperature,
             max_output_tokens=cfg.max_output_tokens,
         )
-        map_bullets.append(out)
+        return split_batch_output(out, len(batch))
+
+    with ThreadPoolExecutor(max_workers=max(cfg.concurrency, 1)) as pool:
+        # executor.map yields in submission order, so chunk order is preserved
+        map_bullets = [b for bullets in pool.map(map_batch, batches) for b in bullets]
 
     # 3) Reduce: merge chunk summaries
     merged_input = "\n\n".join(map_bullets)
     throttle.wait()
-    # user_reduce = cfg.reduce_prompt.replace("{chunk_text}", "").replace("{bullets}", merged_input)
-    user_reduce = f"""{cfg.reduce_prompt}
-
-                   === BULLETS START ===
-                   {merged_input}
-                   === BULLETS END ===
-                   """
+    # no indentation inside the prompt: stray leading spaces are billed as tokens
+    user_reduce = build_reduce_prompt(cfg.reduce_prompt, merged_input)
     reduce_out = chat_complete(
         client=client,
         model=cfg.model,
@@ -241,36 +336,131 @@ def summarize_one_video(
     return tldr, bullets_md
 
 
-# ---------- CSV/MD writers ----------
+# ---------- Video worker processes ----------
 
+# Per-process state for the video pool: the OpenAI client, encoder and throttle are not
+# picklable, so each worker builds its own in _init_worker.
+_worker: dict = {}
 
-def append_csv(path: Path, header: List[str], rows: List[List[str]]) -> None:
-    ensure_dirs(path)
-    file_exists = path.exists()
-    with path.open("a", newline="", encoding="utf-8") as f:
-        w = csv.writer(f)
-        if not file_exists:
-            w.writerow(header)
-        for r in rows:
-            w.writerow(r)
 
+def _init_worker(cfg: Config, rps: float) -> None:
+    _worker["cfg"] = cfg
+    _worker["client"] = build_client()
+    _worker["enc"] = get_encoder_for_model(cfg.model)
+    _worker["throttle"] = RateLimiter(rps)
 
-def append_md(path: Path, block: str) -> None:
-    ensure_dirs(path)
-    with path.open("a", encoding="utf-8") as f:
-        f.write(block)
-        if not block.endswith("\n"):
-            f.write("\n")
+
+def _summarize_in_worker(record: dict) -> Tuple[str, str]:
+    return summarize_one_video(
+        record, _worker["cfg"], _worker["client"], _worker["enc"], _worker["throttle"]
+    )
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def map_bounded(
+    executor: Executor, fn: Callable[[T], R], items: Iterable[T], window: int
+) -> Iterator[Tuple[T, R]]:
+    """
+    Like executor.map, yielding (item, result) in input order, but with at most *window*
+    items in flight so *items* is consumed lazily rather than all submitted up front.
+    """
+    pending: Deque[Tuple[T, Future]] = deque()
+    try:
+        for item in items:
+            pending.append((item, executor.submit(fn, item)))
+            if len(pending) >= window:
+                item, fut = pending.popleft()
+                yield item, fut.result()
+        while pending:
+            item, fut = pending.popleft()
+            yield item, fut.result()
+    finally:
+        for _, fut in pending:
+            fut.cancel()
+
+
+# ---------- CSV/MD writers ----------
+
+
+class SummaryWriter:
+    """Keeps the CSV/MD outputs open for the whole run and writes them in batches."""
+
+    def __init__(self, csv_path: Path, md_path: Path, header: List[str], flush_every: int = 5):
+        self.flush_every = flush_every
+        self._rows: List[List[str]] = []
+        self._md: List[str] = []
+
+        ensure_dirs(csv_path)
+        ensure_dirs(md_path)
+        write_header = not csv_path.exists()
+        done_path = done_ids_path(csv_path)
+        if write_header:
+            done_path.unlink(missing_ok=True)  # stale sidecar of a removed CSV
+        elif not done_path.exists():
+            already_done_ids(csv_path)  # seed the sidecar from an older CSV
+        self._csv_f = csv_path.open("a", newline="", encoding="utf-8")
+        self._md_f = md_path.open("a", encoding="utf-8")
+        self._done_f = done_path.open("a", encoding="utf-8")
+        self._csv_w = csv.writer(self._csv_f)
+        if write_header:
+            self._csv_w.writerow(header)
+
+    def add(self, row: List[str], md_block: str) -> None:
+        self._rows.append(row)
+        self._md.append(md_block if md_block.endswith("\n") else md_block + "\n")
+        # flush every few items to be robust
+        if len(self._rows) >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        self._csv_w.writerows(self._rows)
+        self._md_f.writelines(self._md)
+        self._csv_f.flush()
+        self._md_f.flush()
+        # ids go to the resume sidecar only once their rows are on disk
+        self._done_f.writelines(f"{row[0]}\n" for row in self._rows)
+        self._done_f.flush()
+        self._rows.clear()
+        self._md.clear()
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            self._csv_f.close()
+            self._md_f.close()
+            self._done_f.close()
+
+    def __enter__(self) -> "SummaryWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def done_ids_path(csv_path: Path) -> Path:
+    """Sidecar next to the output CSV listing finished video ids, one per line."""
+    return csv_path.with_suffix(".done.txt")
 
 
 def already_done_ids(csv_path: Path) -> set[str]:
     if not csv_path.exists():
         return set()
+    done_path = done_ids_path(csv_path)
+    if done_path.exists():
+        return set(done_path.read_text(encoding="utf-8").split())
+
+    # Outputs from before the sidecar existed: scan the CSV once and write the sidecar
     out = set()
-    with csv_path.open("r", encoding="utf-8") as f:
+    with csv_path.open("r", newline="", encoding="utf-8") as f:
         reader = csv.DictReader(f)
         for row in reader:
             out.add(row.get("id", ""))
+    out.discard("")
+    done_path.write_text("".join(f"{vid}\n" for vid in sorted(out)), encoding="utf-8")
     return out
 
 
@@ -280,7 +470,12 @@ def already_done_ids(csv_path: Path) -> set[str]:
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Summarize transcripts.jsonl into CSV/Markdown.")
     p.add_argument("--config", default="config/summarizer.yaml", help="Path to YAML config.")
-    p.add_argument("--limit", type=int, default=None, help="Only process first N transcripts.")
+    p.add_argument(
+        "--limit",
+        type=int,
+        default=None,
+        help="Summarize at most N transcripts (counted after --ids/--resume filtering).",
+    )
     p.add_argument(
         "--resume", action="store_true", help="Skip videos already present in output CSV."
     )
@@ -303,10 +498,6 @@ def main():
         print(f"Input not found: {in_path}", file=sys.stderr)
         sys.exit(1)
 
-    client = build_client()
-    enc = get_encoder_for_model(cfg.model)
-    throttle = RateLimiter(cfg.rate_limit_rps)
-
     # Resume support
     done = already_done_ids(out_csv) if args.resume else set()
 
@@ -322,28 +513,26 @@ def main():
         "summary_bullets_md",
     ]
 
-    count = 0
-    rows_batch: List[List[str]] = []
-
-    records = list(iter_jsonl(in_path))
-    if args.limit:
-        records = records[: args.limit]
-    if args.ids:
-        target = {s.strip() for s in args.ids.split(",") if s.strip()}
-        records = [r for r in records if r.get("meta", {}).get("id", "") in target]
-
-    for rec in tqdm(records, desc="Summarizing"):
-        vid = rec.get("meta", {}).get("id", "")
-        if not vid:
-            continue
-        if args.resume and vid in done:
-            continue
-
-        tldr, bullets_md = summarize_one_video(rec, cfg, client, enc, throttle)
-
-        meta = rec.get("meta", {})
-        rows_batch.append(
-            [
+    target = {s.strip() for s in args.ids.split(",") if s.strip()} if args.ids else None
+    # streamed: records are read lazily and reading stops once --limit is reached
+    records = select_records(iter_jsonl(in_path), done=done, ids=target, limit=args.limit)
+
+    # Whole videos fan out across processes so tokenization sidesteps the GIL; each worker
+    # still runs its map calls on threads. The rate limit is split so the total stays capped.
+    # "spawn" because tiktoken encoders are not safe to inherit across fork.
+    workers = max(cfg.concurrency, 1)
+    pool = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(cfg, cfg.rate_limit_rps / workers),
+    )
+    with pool, SummaryWriter(out_csv, out_md, header) as writer:
+        # CSV/MD writes stay in this process, in input order
+        results = map_bounded(pool, _summarize_in_worker, records, window=workers * 2)
+        for rec, (tldr, bullets_md) in tqdm(results, desc="Summarizing", total=args.limit):
+            meta = rec.get("meta", {})
+            row = [
                 meta.get("id", ""),
                 meta.get("title", ""),
                 meta.get("url", ""),
@@ -354,10 +543,9 @@ def main():
                 tldr,
                 bullets_md,
             ]
-        )
 
-        # Append to MD file as a section
-        md_block = f"""# {meta.get('title','(untitled)')}
+            # MD file gets one section per video
+            md_block = f"""# {meta.get('title','(untitled)')}
 **URL:** {meta.get('url','')}
 **Uploaded:** {meta.get('upload_date','')}
 **Language:** {rec.get('language','')} | **Auto-captions:** {rec.get('is_generated','')}
@@ -368,16 +556,7 @@ def main():
 
 ---
 """
-        append_md(out_md, md_block)
-
-        count += 1
-        # flush CSV every few items to be robust
-        if len(rows_batch) >= 5:
-            append_csv(out_csv, header, rows_batch)
-            rows_batch = []
-
-    if rows_batch:
-        append_csv(out_csv, header, rows_batch)
+            writer.add(row, md_block)
 
     print(f"Done. Wrote: {out_csv} and {out_md}")
 
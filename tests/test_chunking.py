@@ -1,4 +1,4 @@
-from summarize import chunk_text_by_tokens
+from summarize import MAP_SEP, chunk_text_by_tokens, pack_chunks, split_batch_output
 
 
 class DummyEncoder:
@@ -26,3 +26,42 @@ def test_chunk_text_by_tokens_single_chunk():
     text = "one two"
     chunks = chunk_text_by_tokens(text, chunk_size=10, overlap=0, enc=enc)
     assert chunks == ["one two"]
+
+
+def test_chunk_text_by_tokens_short_text_skips_encoder():
+    class NoEncode(DummyEncoder):
+        def encode(self, text: str):
+            raise AssertionError("encoder should not be called")
+
+    chunks = chunk_text_by_tokens("one two", chunk_size=10, overlap=0, enc=NoEncode())
+    assert chunks == ["one two"]
+
+
+def test_chunk_text_by_tokens_single_chunk_returns_text_verbatim():
+    enc = DummyEncoder()
+    text = "one   two   three   four"
+    chunks = chunk_text_by_tokens(text, chunk_size=5, overlap=0, enc=enc)
+    assert chunks == [text]
+
+
+def test_pack_chunks_groups_within_budget():
+    chunks = ["a b", "c d", "e f", "h"]
+    batches = pack_chunks(chunks, max_ctx_tokens=5, chunk_tokens=2, overhead=0)
+    assert batches == [["a b", "c d"], ["e f", "h"]]
+
+
+def test_pack_chunks_keeps_oversized_chunk_alone():
+    batches = pack_chunks(["a b c d e f", "g"], max_ctx_tokens=3, chunk_tokens=6, overhead=0)
+    assert batches == [["a b c d e f"], ["g"]]
+
+
+def test_pack_chunks_single_or_no_chunk():
+    assert pack_chunks(["a"], max_ctx_tokens=1, chunk_tokens=10) == [["a"]]
+    assert pack_chunks([], max_ctx_tokens=1, chunk_tokens=10) == []
+
+
+def test_split_batch_output():
+    out = f"- one\n{MAP_SEP}\n- two\n"
+    assert split_batch_output(out, 2) == ["- one", "- two"]
+    # separator count mismatch falls back to the whole response
+    assert split_batch_output(out, 3) == [out.strip()]
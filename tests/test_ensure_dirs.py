@@ -8,6 +8,7 @@ def test_channel_dump_ensure_dirs(tmp_path):
     assert (tmp_path / "data" / "raw" / "transcripts").is_dir()
     assert paths["manifest_csv"] == tmp_path / "data" / "raw" / "manifest.csv"
     assert paths["transcripts_jsonl"] == tmp_path / "data" / "raw" / "transcripts.jsonl"
+    assert paths["cache_db"] == tmp_path / ".cache" / "transcripts.sqlite"
 
 
 def test_summarize_ensure_dirs(tmp_path):
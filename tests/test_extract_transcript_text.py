@@ -4,11 +4,11 @@ import sys
 from pathlib import Path
 
 
-def run_script(json_path: Path, cwd: Path) -> subprocess.CompletedProcess:
+def run_script(*args: str | Path, cwd: Path) -> subprocess.CompletedProcess:
     repo_root = Path(__file__).resolve().parent.parent
     script = repo_root / "scripts" / "extract_transcript_text.py"
     return subprocess.run(
-        [sys.executable, str(script), str(json_path)],
+        [sys.executable, str(script), *map(str, args)],
         cwd=cwd,
         capture_output=True,
         text=True,
@@ -19,7 +19,7 @@ def test_extract_transcript_text_success(tmp_path: Path) -> None:
     json_file = tmp_path / "sample.json"
     json_file.write_text(json.dumps({"text": "hello world"}))
 
-    result = run_script(json_file, tmp_path)
+    result = run_script(json_file, cwd=tmp_path)
     assert result.returncode == 0, result.stderr
 
     out_file = tmp_path / "data" / "transcript_text" / "sample.txt"
@@ -30,7 +30,7 @@ def test_extract_transcript_text_missing_text(tmp_path: Path) -> None:
     json_file = tmp_path / "missing.json"
     json_file.write_text(json.dumps({"nope": "data"}))
 
-    result = run_script(json_file, tmp_path)
+    result = run_script(json_file, cwd=tmp_path)
     assert result.returncode != 0
     assert "Missing 'text' field" in result.stderr
 
@@ -39,6 +39,33 @@ def test_extract_transcript_text_malformed_json(tmp_path: Path) -> None:
     json_file = tmp_path / "bad.json"
     json_file.write_text("{not json}")
 
-    result = run_script(json_file, tmp_path)
+    result = run_script(json_file, cwd=tmp_path)
     assert result.returncode != 0
     assert "Malformed JSON" in result.stderr
+
+
+def test_extract_transcript_text_multiple_files(tmp_path: Path) -> None:
+    first = tmp_path / "first.json"
+    second = tmp_path / "second.json"
+    first.write_text(json.dumps({"text": "one"}))
+    second.write_text(json.dumps({"text": "two"}))
+
+    result = run_script(first, second, cwd=tmp_path)
+    assert result.returncode == 0, result.stderr
+
+    out_dir = tmp_path / "data" / "transcript_text"
+    assert (out_dir / "first.txt").read_text() == "one"
+    assert (out_dir / "second.txt").read_text() == "two"
+
+
+def test_extract_transcript_text_glob_reports_failures(tmp_path: Path) -> None:
+    src = tmp_path / "transcripts"
+    src.mkdir()
+    (src / "good.json").write_text(json.dumps({"text": "ok"}))
+    (src / "bad.json").write_text("{not json}")
+
+    result = run_script("--glob", "transcripts/*.json", cwd=tmp_path)
+    assert result.returncode != 0
+    assert "bad.json" in result.stderr and "Malformed JSON" in result.stderr
+    # failures do not stop the rest of the batch
+    assert (tmp_path / "data" / "transcript_text" / "good.txt").read_text() == "ok"
@@ -0,0 +1,47 @@
+import time
+
+import orjson
+
+import channel_dump
+from channel_dump import VideoMeta, fetch_and_store
+
+
+def _video(vid: str) -> VideoMeta:
+    return VideoMeta(
+        vid, f"Title {vid}", f"https://www.youtube.com/watch?v={vid}", None, None, 1, 1
+    )
+
+
+def test_fetch_and_store_writes_each_record_once_in_channel_order(tmp_path, monkeypatch):
+    videos = [_video(f"v{i}") for i in range(5)]
+    calls = []
+
+    def fake_pick(video_id, preferred_langs):
+        calls.append(video_id)
+        # later videos finish first, so completion order is the reverse of channel order
+        time.sleep(0.01 * (5 - int(video_id[1:])))
+        if video_id == "v3":
+            return None
+        return {"lang": "en", "is_generated": False, "segments": [{"text": video_id}]}
+
+    monkeypatch.setattr(channel_dump, "list_channel_videos", lambda url, max_videos: videos)
+    monkeypatch.setattr(channel_dump, "pick_transcript_variant", fake_pick)
+    tx_dir = tmp_path / "data" / "raw" / "transcripts"
+    tx_dir.mkdir(parents=True)
+    (tx_dir / "v1.json").write_text("existing")
+
+    fetch_and_store(
+        "https://www.youtube.com/@x",
+        tmp_path,
+        ["en"],
+        delay_s=0,
+        concurrency=4,
+        use_cache=False,
+    )
+
+    assert sorted(calls) == ["v0", "v2", "v3", "v4"]
+    lines = (tmp_path / "data" / "raw" / "transcripts.jsonl").read_bytes().splitlines()
+    assert [orjson.loads(line)["meta"]["id"] for line in lines] == ["v0", "v2", "v4"]
+    assert sorted(p.name for p in tx_dir.iterdir()) == ["v0.json", "v1.json", "v2.json", "v4.json"]
+    assert (tx_dir / "v1.json").read_text() == "existing"
+    assert orjson.loads((tx_dir / "v4.json").read_bytes())["text"] == "v4"
@@ -0,0 +1,30 @@
+from summarize import iter_jsonl, select_records
+
+
+def test_iter_jsonl_skips_blank_lines(tmp_path):
+    path = tmp_path / "transcripts.jsonl"
+    path.write_bytes(b'{"id": "a"}\n\n   \n{"id": "b", "text": "h\xc3\xa9"}\r\n')
+    assert list(iter_jsonl(path)) == [{"id": "a"}, {"id": "b", "text": "hé"}]
+
+
+def _rec(vid):
+    return {"meta": {"id": vid}}
+
+
+def test_select_records_filters_lazily():
+    consumed = []
+
+    def source():
+        for vid in ["a", "", "b", "c", "d", "e"]:
+            consumed.append(vid)
+            yield _rec(vid)
+
+    out = select_records(source(), done={"b"}, ids={"a", "b", "c", "d"}, limit=2)
+    assert [r["meta"]["id"] for r in out] == ["a", "c"]
+    # stops reading as soon as the limit is reached
+    assert consumed == ["a", "", "b", "c"]
+
+
+def test_select_records_without_filters():
+    out = select_records([_rec("a"), _rec("b")], done=set())
+    assert [r["meta"]["id"] for r in out] == ["a", "b"]
@@ -0,0 +1,19 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from summarize import map_bounded
+
+
+def test_map_bounded_keeps_order_and_reads_lazily():
+    consumed = []
+
+    def items():
+        for i in range(6):
+            consumed.append(i)
+            yield i
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        results = map_bounded(pool, lambda x: x * 10, items(), window=2)
+        assert next(results) == (0, 0)
+        # only a window's worth of items has been pulled from the source
+        assert consumed == [0, 1]
+        assert list(results) == [(i, i * 10) for i in range(1, 6)]
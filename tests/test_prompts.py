@@ -0,0 +1,16 @@
+from summarize import build_map_prompt, build_reduce_prompt
+
+
+def test_build_map_prompt_appends_chunks_last():
+    prompt = build_map_prompt("Summarize these.\n---\n", "[1]\nhello")
+    assert prompt == "Summarize these.\n---\n\n[1]\nhello"
+
+
+def test_build_map_prompt_drops_legacy_placeholder():
+    prompt = build_map_prompt("Summarize this CHUNK.\n---\n{chunk_text}\n", "[1]\nhello")
+    assert prompt == "Summarize this CHUNK.\n---\n\n[1]\nhello"
+
+
+def test_build_reduce_prompt_has_no_indentation():
+    prompt = build_reduce_prompt("Merge these.\n", "- a\n\n- b")
+    assert prompt == "Merge these.\n\n=== BULLETS START ===\n- a\n\n- b\n=== BULLETS END ==="
@@ -0,0 +1,55 @@
+import pytest
+
+import summarize
+from summarize import RateLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+        self.advance_on_sleep = True
+
+    def perf_counter(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        if self.advance_on_sleep:
+            self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(summarize.time, "perf_counter", fake.perf_counter)
+    monkeypatch.setattr(summarize.time, "sleep", fake.sleep)
+    return fake
+
+
+def test_rate_limiter_allows_burst_then_throttles(clock):
+    limiter = RateLimiter(rps=2)
+    limiter.wait()
+    limiter.wait()
+    assert clock.sleeps == []  # a full bucket absorbs the burst
+    limiter.wait()
+    assert clock.sleeps == [pytest.approx(0.5)]
+
+
+def test_rate_limiter_refills_over_time(clock):
+    limiter = RateLimiter(rps=1, burst=1)
+    limiter.wait()
+    clock.now += 5  # idle time refills, but never beyond capacity
+    limiter.wait()
+    limiter.wait()
+    assert clock.sleeps == [pytest.approx(1.0)]
+
+
+def test_rate_limiter_queued_callers_accumulate_debt(clock):
+    limiter = RateLimiter(rps=4, burst=1)
+    limiter.wait()
+    # two callers arriving at the same instant, before either has finished sleeping
+    clock.advance_on_sleep = False
+    limiter.wait()
+    limiter.wait()
+    assert clock.sleeps == [pytest.approx(0.25), pytest.approx(0.5)]
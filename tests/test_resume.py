@@ -0,0 +1,36 @@
+from summarize import SummaryWriter, already_done_ids, done_ids_path
+
+HEADER = ["id", "tldr"]
+
+
+def test_already_done_ids_without_outputs(tmp_path):
+    assert already_done_ids(tmp_path / "summaries.csv") == set()
+
+
+def test_already_done_ids_reads_sidecar(tmp_path):
+    out_csv = tmp_path / "summaries.csv"
+    with SummaryWriter(out_csv, tmp_path / "summaries.md", HEADER) as writer:
+        writer.add(["a", "x"], "# A\n")
+        writer.add(["b", "y"], "# B\n")
+
+    assert done_ids_path(out_csv) == tmp_path / "summaries.done.txt"
+    assert done_ids_path(out_csv).read_text() == "a\nb\n"
+    assert already_done_ids(out_csv) == {"a", "b"}
+
+
+def test_already_done_ids_seeds_sidecar_from_csv(tmp_path):
+    out_csv = tmp_path / "summaries.csv"
+    out_csv.write_text("id,tldr\na,x\nb,y\n", encoding="utf-8")
+
+    assert already_done_ids(out_csv) == {"a", "b"}
+    assert done_ids_path(out_csv).read_text() == "a\nb\n"
+
+
+def test_summary_writer_keeps_ids_from_older_csv(tmp_path):
+    out_csv = tmp_path / "summaries.csv"
+    out_csv.write_text("id,tldr\na,x\n", encoding="utf-8")
+
+    with SummaryWriter(out_csv, tmp_path / "summaries.md", HEADER) as writer:
+        writer.add(["b", "y"], "# B\n")
+
+    assert already_done_ids(out_csv) == {"a", "b"}
@@ -0,0 +1,11 @@
+from channel_dump import segments_to_text
+
+
+def test_segments_to_text_joins_stripped_lines():
+    segments = [{"text": "  hello "}, {"text": ""}, {"text": None}, {}, {"text": "0"}]
+    assert segments_to_text(segments) == "hello\n0"
+
+
+def test_segments_to_text_empty():
+    assert segments_to_text([]) == ""
+    assert segments_to_text([{"text": "   "}]) == ""
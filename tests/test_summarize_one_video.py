@@ -0,0 +1,53 @@
+from types import SimpleNamespace
+
+from summarize import Config, RateLimiter, summarize_one_video
+
+
+class NoEncode:
+    def encode(self, text):
+        raise AssertionError("encoder should not be called")
+
+    def decode(self, tokens):
+        raise AssertionError("encoder should not be called")
+
+
+class FakeClient:
+    def __init__(self):
+        self.prompts = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, **kwargs):
+        user = kwargs["messages"][1]["content"]
+        self.prompts.append(user)
+        content = "TL;DR: short\n- merged" if "BULLETS START" in user else "- bullet"
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def _config() -> Config:
+    return Config(
+        provider="openai",
+        model="test",
+        temperature=0.0,
+        max_output_tokens=100,
+        chunk_size_tokens=2000,
+        chunk_overlap_tokens=200,
+        map_batch_tokens=4500,
+        input_jsonl="",
+        output_csv="",
+        output_md="",
+        concurrency=2,
+        rate_limit_rps=1000,
+        map_prompt="Summarize each chunk.\n---\n",
+        reduce_prompt="Merge.",
+    )
+
+
+def test_short_transcript_never_touches_encoder():
+    client = FakeClient()
+    record = {"text": "a short transcript"}
+
+    tldr, bullets = summarize_one_video(record, _config(), client, NoEncode(), RateLimiter(1000))
+
+    assert (tldr, bullets) == ("TL;DR: short", "- merged")
+    assert len(client.prompts) == 2  # one map call, one reduce call
+    assert client.prompts[0].endswith("[1]\na short transcript")
@@ -0,0 +1,26 @@
+import csv
+
+from summarize import SummaryWriter
+
+HEADER = ["id", "tldr"]
+
+
+def test_summary_writer_batches_and_appends(tmp_path):
+    out_csv = tmp_path / "out" / "summaries.csv"
+    out_md = tmp_path / "out" / "summaries.md"
+
+    with SummaryWriter(out_csv, out_md, HEADER, flush_every=2) as writer:
+        writer.add(["a", "first"], "# A")
+        assert out_md.read_text() == ""  # buffered until the batch fills
+        writer.add(["b", "second"], "# B\n")
+        assert out_md.read_text() == "# A\n# B\n"
+        writer.add(["c", "third"], "# C\n")
+
+    # a second run appends without repeating the header
+    with SummaryWriter(out_csv, out_md, HEADER) as writer:
+        writer.add(["d", "fourth"], "# D\n")
+
+    with out_csv.open(newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    assert rows == [HEADER, ["a", "first"], ["b", "second"], ["c", "third"], ["d", "fourth"]]
+    assert out_md.read_text() == "# A\n# B\n# C\n# D\n"
@@ -0,0 +1,22 @@
+from channel_dump import TranscriptCache, VideoMeta
+
+
+def test_transcript_roundtrip(tmp_path):
+    cache = TranscriptCache(tmp_path / ".cache" / "transcripts.sqlite")
+    variant = {"lang": "en", "is_generated": False, "segments": [{"text": "héllo"}]}
+    assert cache.get_transcript("abc", ["en"]) is None
+    cache.put_transcript("abc", ["en"], variant)
+    assert cache.get_transcript("abc", ["en"]) == variant
+    # language preference is part of the key
+    assert cache.get_transcript("abc", ["de"]) is None
+    cache.close()
+
+
+def test_listing_expires(tmp_path):
+    cache = TranscriptCache(tmp_path / "cache.sqlite")
+    videos = [VideoMeta("abc", "Title", "https://youtu.be/abc", None, None, 60, None)]
+    cache.put_listing("https://www.youtube.com/@x", None, videos)
+    assert cache.get_listing("https://www.youtube.com/@x", None) == videos
+    assert cache.get_listing("https://www.youtube.com/@x", 5) is None
+    assert cache.get_listing("https://www.youtube.com/@x", None, ttl_s=-1) is None
+    cache.close()
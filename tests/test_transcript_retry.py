@@ -0,0 +1,82 @@
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+import requests
+from tenacity import wait_none
+from youtube_transcript_api import (
+    IpBlocked,
+    Transcript,
+    TranscriptsDisabled,
+    YouTubeRequestFailed,
+)
+
+import channel_dump
+from channel_dump import _fetch_with_retry
+
+
+class FlakyTranscript:
+    def __init__(self, errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def fetch(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return [{"text": "ok"}]
+
+
+def test_fetch_retries_throttling():
+    t = FlakyTranscript([IpBlocked("vid"), IpBlocked("vid")])
+    assert _fetch_with_retry.retry_with(wait=wait_none())(t) == [{"text": "ok"}]
+    assert t.calls == 3
+
+
+def test_fetch_does_not_retry_terminal_errors():
+    t = FlakyTranscript([TranscriptsDisabled("vid")])
+    with pytest.raises(TranscriptsDisabled):
+        _fetch_with_retry.retry_with(wait=wait_none())(t)
+    assert t.calls == 1
+
+
+def test_fetch_does_not_retry_http_client_errors():
+    response = requests.Response()
+    response.status_code = 404
+    error = YouTubeRequestFailed("vid", requests.HTTPError("404 Not Found", response=response))
+    t = FlakyTranscript([error])
+    with pytest.raises(YouTubeRequestFailed):
+        _fetch_with_retry.retry_with(wait=wait_none())(t)
+    assert t.calls == 1
+
+
+def test_throttled_fetch_is_retried_by_one_layer_only(monkeypatch):
+    hits = []
+
+    class AlwaysThrottled(BaseHTTPRequestHandler):
+        def do_GET(self):
+            hits.append(self.path)
+            self.send_response(429)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), AlwaysThrottled)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(channel_dump, "_local", threading.local())
+    session = channel_dump._get_session()
+    # the local server is plain http; route it through the same pooled, retrying adapter
+    session.mount("http://", session.get_adapter("https://example.com"))
+    url = f"http://127.0.0.1:{server.server_port}/timedtext"
+    t = Transcript(session, "vid", url, "English", "en", False, [])
+    try:
+        with pytest.raises(IpBlocked):
+            _fetch_with_retry.retry_with(wait=wait_none())(t)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    # five tenacity attempts, one HTTP request each
+    assert len(hits) == 5